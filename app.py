@@ -3,42 +3,79 @@ Caretria Sample Dashboard
 Production-grade OTC Pharmacy Sales Analytics
 """
 
+import itertools
 import os
+import threading
+from functools import lru_cache
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 import dash
 from dash import dcc, html
 from dash.dependencies import Input, Output
 from dash.exceptions import PreventUpdate
+from flask_caching import Cache
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
-import plotly.express as px
-from scipy import stats
-from scipy.stats import shapiro, kstest, normaltest
+
+# scipy is only needed by the Statistical Analysis tab; it is imported inside
+# the _qq_cached and _run_normality helpers to keep it off the startup path.
 
 # -----------------------------------------------------------------------------
 # Data Loading & Preprocessing
 # -----------------------------------------------------------------------------
 
 DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pharmacy_otc_sales_data.csv")
+CACHE_PATH = os.path.splitext(DATA_PATH)[0] + ".arrow"
+CATEGORY_COLUMNS = ("Product", "Sales Person", "Country")
 
 
 def load_data():
-    """Load and preprocess pharmacy OTC sales data."""
-    df = pd.read_csv(DATA_PATH)
+    """Load and preprocess pharmacy OTC sales data.
+
+    The preprocessed frame is cached as an uncompressed Arrow IPC file next to
+    the CSV and reused for as long as it is newer than both the CSV and this
+    module (so changes to the preprocessing below invalidate it). Reading it
+    back skips CSV parsing and preprocessing at startup; ``to_pandas`` still
+    copies the columns, so each worker holds its own frame.
+    """
+    source_mtime = max(os.path.getmtime(DATA_PATH), os.path.getmtime(__file__))
+    if os.path.exists(CACHE_PATH) and os.path.getmtime(CACHE_PATH) >= source_mtime:
+        with pa.memory_map(CACHE_PATH) as source:
+            return pa.ipc.open_file(source).read_all().to_pandas()
+
+    # Arrow's multithreaded reader parses dates and dictionary-encodes the
+    # string keys straight into datetime64/category columns.
+    df = pd.read_csv(
+        DATA_PATH,
+        engine="pyarrow",
+        dtype={col: "category" for col in CATEGORY_COLUMNS},
+        parse_dates=["Date"],
+    )
     # Normalize column names
     df.columns = [c.replace("Amount ($)", "Amount").strip() for c in df.columns]
-    df["Date"] = pd.to_datetime(df["Date"])
-    df["Month"] = df["Date"].dt.month
-    df["MonthName"] = df["Date"].dt.strftime("%b")
-    df["DayOfWeek"] = df["Date"].dt.dayofweek
-    df["DayName"] = df["Date"].dt.strftime("%a")
-    df["Year"] = df["Date"].dt.year
+    # Box counts fit in a narrow integer; Amount stays float64 so cent values
+    # serialize exactly into hover labels and the per-product means.
+    df["Boxes Shipped"] = pd.to_numeric(df["Boxes Shipped"], downcast="integer")
+    # Only the integer month / weekday are aggregated on; keep them narrow and
+    # add them in a single block append rather than one __setitem__ per column.
+    dt = df["Date"].dt
+    df = df.assign(Month=dt.month.astype("int8"), DayOfWeek=dt.dayofweek.astype("int8"))
+    try:
+        # Write to a per-process temp file and rename, so workers booting at
+        # the same time never map a partially written cache.
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        tmp_path = f"{CACHE_PATH}.{os.getpid()}.tmp"
+        with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        pass  # read-only checkout: fall back to parsing the CSV on every start
     return df
 
 
-df_raw = load_data()
-df = df_raw.copy()
+df = load_data()
 
 # Precompute KPIs
 total_revenue = df["Amount"].sum()
@@ -49,6 +86,62 @@ unique_sales_people = df["Sales Person"].nunique()
 total_transactions = len(df)
 avg_order_value = round(total_revenue / total_transactions, 2)
 
+
+def rank_rows(pivot, ascending=False):
+    """Map each row key of ``pivot`` to its non-empty cells sorted by value."""
+    return {key: row[row > 0].sort_values(ascending=ascending, kind="stable") for key, row in pivot.iterrows()}
+
+
+# Precompute per-dimension aggregations shared by the tab callbacks
+PRODUCT_REV = df.groupby("Product", observed=True, sort=False)["Amount"].sum().sort_values()
+PRODUCT_BOXES = df.groupby("Product", observed=True, sort=False)["Boxes Shipped"].sum()
+PRODUCT_TX_COUNT = df.groupby("Product", observed=True, sort=False).size()
+PRODUCT_MONTHLY = df.groupby(["Product", "Month"], observed=True)["Amount"].sum().unstack(fill_value=0)
+PRODUCT_DOW = df.groupby(["Product", "DayOfWeek"], observed=True, sort=False)["Amount"].sum().unstack(fill_value=0)
+PRODUCTS_BY_REV_DESC = PRODUCT_REV.sort_values(ascending=False).index.tolist()
+
+SALESPERSON_MONTHLY = df.groupby(["Sales Person", "Month"], observed=True)["Amount"].sum().unstack(fill_value=0)
+SALESPERSON_PRODUCT_TX = df.groupby(["Sales Person", "Product"], observed=True).size().unstack(fill_value=0)
+SALESPERSON_PRODUCT_REV = df.groupby(["Sales Person", "Product"], observed=True)["Amount"].sum().unstack(fill_value=0)
+SALESPERSON_COUNTRY_BOXES = (
+    df.groupby(["Sales Person", "Country"], observed=True)["Boxes Shipped"].sum().unstack(fill_value=0)
+)
+SALESPERSON_PRODUCTS_BY_TX = rank_rows(SALESPERSON_PRODUCT_TX)
+SALESPERSON_PRODUCTS_BY_REV = rank_rows(SALESPERSON_PRODUCT_REV)
+
+COUNTRY_REV = df.groupby("Country", observed=True, sort=False)["Amount"].sum()
+COUNTRY_BOXES = df.groupby("Country", observed=True, sort=False)["Boxes Shipped"].sum()
+COUNTRY_N_PRODUCTS = df.groupby("Country", observed=True, sort=False)["Product"].nunique()
+COUNTRY_MONTHLY = df.groupby(["Country", "Month"], observed=True)["Amount"].sum().unstack(fill_value=0)
+COUNTRY_PRODUCT_REV = df.groupby(["Country", "Product"], observed=True)["Amount"].sum().unstack(fill_value=0)
+COUNTRY_SALESPERSON_REV = df.groupby(["Country", "Sales Person"], observed=True)["Amount"].sum().unstack(fill_value=0)
+# Ascending, as drawn by the horizontal bar charts
+COUNTRY_PRODUCTS_BY_REV = rank_rows(COUNTRY_PRODUCT_REV, ascending=True)
+COUNTRY_SALESPEOPLE_BY_REV = rank_rows(COUNTRY_SALESPERSON_REV, ascending=True)
+
+# JSON-ready per-selection summaries, published through each tab's dcc.Store
+PRODUCT_SUMMARY = {
+    p: {"product": p, "rev": float(PRODUCT_REV[p]), "boxes": int(PRODUCT_BOXES[p]), "n": int(PRODUCT_TX_COUNT[p])}
+    for p in PRODUCT_REV.index
+}
+COUNTRY_SUMMARY = {
+    c: {
+        "country": c,
+        "rev": float(COUNTRY_REV[c]),
+        "boxes": int(COUNTRY_BOXES[c]),
+        "products": int(COUNTRY_N_PRODUCTS[c]),
+    }
+    for c in COUNTRY_REV.index
+}
+
+# Dropdown options are static, so build them once instead of on every tab switch
+PRODUCT_OPTIONS = [{"label": p, "value": p} for p in sorted(df["Product"].unique())]
+PRODUCT_DEFAULT = PRODUCT_OPTIONS[0]["value"]
+SALESPERSON_OPTIONS = [{"label": p, "value": p} for p in sorted(df["Sales Person"].unique())]
+SALESPERSON_DEFAULT = SALESPERSON_OPTIONS[0]["value"]
+COUNTRY_OPTIONS = [{"label": c, "value": c} for c in sorted(df["Country"].unique())]
+COUNTRY_DEFAULT = COUNTRY_OPTIONS[0]["value"]
+
 # Caretria brand colors
 CARETRIA_TEAL = "#0D9488"
 CARETRIA_EMERALD = "#10B981"
@@ -74,16 +167,79 @@ PLOT_TEMPLATE = dict(
 )
 
 
-def apply_theme(fig, height=None):
-    """Apply production-grade theme to a Plotly figure."""
-    fig.update_layout(**PLOT_TEMPLATE["layout"])
+# Register the theme once as a Plotly template layered on top of the stock
+# "plotly" one, so every figure picks it up at construction time instead of
+# deep-merging the layout dicts per callback.
+pio.templates["caretria"] = go.layout.Template(
+    layout=PLOT_TEMPLATE["layout"],
+    data=dict(bar=[go.Bar(marker=dict(line=dict(width=0)))]),
+)
+pio.templates.default = "plotly+caretria"
+CARETRIA_TEMPLATE = pio.templates[pio.templates.default].to_plotly_json()
+
+# Themed base layouts for the go.Figure charts, one per chart height. Passing
+# one as ``layout=`` skips applying the default template to every new figure.
+LAYOUTS = {h: go.Layout(template=pio.templates[pio.templates.default], height=h) for h in (280, 300, 340)}
+
+
+# Cell domains of a 2x2 grid, row-major, matching
+# make_subplots(rows=2, cols=2, vertical_spacing=0.14, horizontal_spacing=0.10)
+GRID_2X2_DOMAINS = [
+    ([0.0, 0.45], [0.57, 1.0]),
+    ([0.55, 1.0], [0.57, 1.0]),
+    ([0.0, 0.45], [0.0, 0.43]),
+    ([0.55, 1.0], [0.0, 0.43]),
+]
+
+
+def grid_2x2(cells, titles):
+    """Place four trace dicts on a 2x2 subplot grid without building a Figure.
+
+    ``cells`` holds one ``(trace, axis_titles)`` pair per cell in row-major
+    order. Pie traces are positioned by domain; every other trace gets its own
+    x/y axis pair, titled from ``axis_titles`` (e.g. ``{"xaxis": "Month"}``).
+    Returns ``(data, layout)``.
+    """
+    data = []
+    layout = {"annotations": []}
+    n_axes = 0
+    for (trace, axis_titles), title, (x_domain, y_domain) in zip(cells, titles, GRID_2X2_DOMAINS):
+        if trace["type"] == "pie":
+            trace = {**trace, "domain": {"x": x_domain, "y": y_domain}}
+        else:
+            n_axes += 1
+            suffix = str(n_axes) if n_axes > 1 else ""
+            trace = {**trace, "xaxis": "x" + suffix, "yaxis": "y" + suffix}
+            layout["xaxis" + suffix] = {"anchor": "y" + suffix, "domain": x_domain}
+            layout["yaxis" + suffix] = {"anchor": "x" + suffix, "domain": y_domain}
+            for axis, text in axis_titles.items():
+                layout[axis + suffix]["title"] = {"text": text}
+        data.append(trace)
+        layout["annotations"].append(
+            {
+                "text": title,
+                "font": {"size": 16},
+                "showarrow": False,
+                "x": sum(x_domain) / 2,
+                "xanchor": "center",
+                "xref": "paper",
+                "y": y_domain[1],
+                "yanchor": "bottom",
+                "yref": "paper",
+            }
+        )
+    return data, layout
+
+
+def themed_figure(data, layout, height=None):
+    """Assemble a dict figure on the Caretria theme without building a ``go.Figure``.
+
+    Dict figures skip Plotly's constructor, so the template is attached explicitly.
+    """
+    layout = {**layout, "template": CARETRIA_TEMPLATE}
     if height:
-        fig.update_layout(height=height)
-    try:
-        fig.update_traces(marker=dict(line=dict(width=0)), selector=dict(type="bar"))
-    except Exception:
-        pass
-    return fig
+        layout["height"] = height
+    return {"data": data, "layout": layout}
 
 
 # -----------------------------------------------------------------------------
@@ -97,6 +253,10 @@ app = dash.Dash(
     title="Caretria Sample Dashboard",
 )
 
+# Figure callbacks are pure functions of their inputs over the static dataset,
+# so their serialized output is memoized per input combination.
+cache = Cache(app.server, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 3600})
+
 # -----------------------------------------------------------------------------
 # Layout
 # -----------------------------------------------------------------------------
@@ -184,8 +344,8 @@ def render_tab_content(tab):
                                 html.Label("Product"),
                                 dcc.Dropdown(
                                     id="product-dropdown",
-                                    options=[{"label": p, "value": p} for p in df["Product"].unique()],
-                                    value=df["Product"].unique()[0],
+                                    options=PRODUCT_OPTIONS,
+                                    value=PRODUCT_DEFAULT,
                                     clearable=False,
                                 ),
                             ]
@@ -196,13 +356,14 @@ def render_tab_content(tab):
                                 dcc.RadioItems(
                                     id="product-top-n-radio",
                                     options=[{"label": "Top 5", "value": 5}, {"label": "Top 10", "value": 10}],
-                                    value=7,
+                                    value=5,
                                     inline=True,
                                 ),
                             ]
                         ),
                     ],
                 ),
+                dcc.Store(id="product-agg-store"),
                 html.Div(
                     className="metric-strip",
                     children=[
@@ -230,8 +391,8 @@ def render_tab_content(tab):
                                 html.Label("Sales Person"),
                                 dcc.Dropdown(
                                     id="salesperson-dropdown",
-                                    options=[{"label": p, "value": p} for p in df["Sales Person"].unique()],
-                                    value=df["Sales Person"].unique()[0],
+                                    options=SALESPERSON_OPTIONS,
+                                    value=SALESPERSON_DEFAULT,
                                     clearable=False,
                                 ),
                             ]
@@ -272,14 +433,15 @@ def render_tab_content(tab):
                                 html.Label("Country"),
                                 dcc.Dropdown(
                                     id="country-dropdown",
-                                    options=[{"label": c, "value": c} for c in df["Country"].unique()],
-                                    value=df["Country"].unique()[0],
+                                    options=COUNTRY_OPTIONS,
+                                    value=COUNTRY_DEFAULT,
                                     clearable=False,
                                 ),
                             ]
                         ),
                     ],
                 ),
+                dcc.Store(id="country-agg-store"),
                 html.Div(
                     className="metric-strip",
                     children=[
@@ -308,8 +470,8 @@ def render_tab_content(tab):
                                 html.Label("Product"),
                                 dcc.Dropdown(
                                     id="insight-product-selector",
-                                    options=[{"label": p, "value": p} for p in df["Product"].unique()],
-                                    value=df["Product"].unique()[0],
+                                    options=PRODUCT_OPTIONS,
+                                    value=PRODUCT_DEFAULT,
                                     clearable=False,
                                 ),
                             ]
@@ -510,6 +672,7 @@ def render_tab_content(tab):
                                 ),
                                 dcc.Graph(
                                     id="stat-correlation",
+                                    figure=CORR_FIG,
                                     config={"displayModeBar": True, "displaylogo": False},
                                 ),
                             ],
@@ -526,121 +689,113 @@ def render_tab_content(tab):
 # -----------------------------------------------------------------------------
 
 
+@app.callback(Output("product-agg-store", "data"), Input("product-dropdown", "value"))
+def update_product_store(product):
+    if not product:
+        raise PreventUpdate
+    return PRODUCT_SUMMARY[product]
+
+
 @app.callback(
     [
         Output("product-total-revenue", "children"),
         Output("product-total-boxes", "children"),
         Output("product-transactions", "children"),
     ],
-    Input("product-dropdown", "value"),
+    Input("product-agg-store", "data"),
 )
-def update_product_metrics(product):
-    if not product:
+def update_product_metrics(summary):
+    if not summary:
         raise PreventUpdate
-    f = df[df["Product"] == product]
-    rev = f["Amount"].sum()
-    boxes = f["Boxes Shipped"].sum()
-    n = len(f)
     return (
-        f"Revenue: ${rev:,.0f}",
-        f"Boxes: {boxes:,}",
-        f"Transactions: {n}",
+        f"Revenue: ${summary['rev']:,.0f}",
+        f"Boxes: {summary['boxes']:,}",
+        f"Transactions: {summary['n']}",
     )
 
 
-@app.callback(
-    Output("product-subplots", "figure"),
-    [Input("product-dropdown", "value"), Input("product-top-n-radio", "value")],
-)
-def update_product_figures(product, top_n):
-    top_n = min(top_n or 7, df["Product"].nunique())
-    top_products = df.groupby("Product").agg({"Amount": "sum", "Boxes Shipped": "sum"}).reset_index()
-    top_products = top_products.nlargest(top_n, "Amount")["Product"].tolist()
-    f = df[df["Product"].isin(top_products)]
-
-    fig = make_subplots(
-        rows=2,
-        cols=2,
-        specs=[
-            [{"type": "pie"}, {"type": "bar"}],
-            [{"type": "scatter"}, {"type": "bar"}],
+def _build_product_figure(top_n):
+    top_products = PRODUCTS_BY_REV_DESC[:top_n]
+    rev_by_product = PRODUCT_REV.loc[top_products[::-1]]  # ascending for the bar chart
+    colors = [CARETRIA_TEAL, CARETRIA_EMERALD, CARETRIA_DARK, CARETRIA_LIGHT, CARETRIA_ACCENT, "#94a3b8", "#cbd5e1"][
+        :top_n
+    ]
+    monthly = PRODUCT_MONTHLY.loc[top_products].sum(axis=0)
+    dow_order = [0, 1, 2, 3, 4, 5, 6]  # Mon-Sun (pandas dayofweek)
+    dow_labels = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+    by_dow = PRODUCT_DOW.loc[top_products].sum(axis=0).reindex(dow_order, fill_value=0)
+
+    data, layout = grid_2x2(
+        [
+            (
+                {
+                    "type": "pie",
+                    "labels": rev_by_product.index.tolist(),
+                    "values": rev_by_product.to_numpy(),
+                    "hole": 0.5,
+                    "marker": {"colors": colors},
+                    "textinfo": "percent",
+                    "textposition": "inside",
+                    "insidetextorientation": "horizontal",
+                    "hovertemplate": "%{label}<br>%{percent}<extra></extra>",
+                    "showlegend": False,
+                },
+                {},
+            ),
+            (
+                {
+                    "type": "bar",
+                    "y": rev_by_product.index.tolist(),
+                    "x": rev_by_product.to_numpy(),
+                    "orientation": "h",
+                    "marker": {"color": CARETRIA_TEAL},
+                    "showlegend": False,
+                },
+                {"xaxis": "Revenue ($)"},
+            ),
+            (
+                {
+                    "type": "scatter",
+                    "x": monthly.index.tolist(),
+                    "y": monthly.to_numpy(),
+                    "mode": "lines+markers",
+                    "line": {"color": CARETRIA_TEAL, "width": 2},
+                    "marker": {"size": 6},
+                    "showlegend": False,
+                },
+                {"xaxis": "Month", "yaxis": "Revenue ($)"},
+            ),
+            (
+                {
+                    "type": "bar",
+                    "x": dow_labels,
+                    "y": by_dow.to_numpy(),
+                    "marker": {"color": CARETRIA_ACCENT},
+                    "showlegend": False,
+                },
+                {"xaxis": "Day", "yaxis": "Revenue ($)"},
+            ),
         ],
-        subplot_titles=(
+        titles=(
             "Revenue share (top products)",
             "Revenue by product",
             "Monthly revenue trend",
             "Revenue by day of week",
         ),
-        vertical_spacing=0.14,
-        horizontal_spacing=0.10,
     )
+    return themed_figure(data, layout, height=650)
 
-    rev_by_product = df[df["Product"].isin(top_products)].groupby("Product")["Amount"].sum().sort_values(ascending=True)
-    colors = [CARETRIA_TEAL, CARETRIA_EMERALD, CARETRIA_DARK, CARETRIA_LIGHT, CARETRIA_ACCENT, "#94a3b8", "#cbd5e1"][
-        :top_n
-    ]
-    fig.add_trace(
-        go.Pie(
-            labels=rev_by_product.index,
-            values=rev_by_product.values,
-            hole=0.5,
-            marker=dict(colors=colors),
-            textinfo="percent",
-            textposition="inside",
-            insidetextorientation="horizontal",
-            hovertemplate="%{label}<br>%{percent}<extra></extra>",
-            showlegend=False,
-        ),
-        row=1,
-        col=1,
-    )
-    fig.add_trace(
-        go.Bar(
-            y=rev_by_product.index,
-            x=rev_by_product.values,
-            orientation="h",
-            marker_color=CARETRIA_TEAL,
-            showlegend=False,
-        ),
-        row=1,
-        col=2,
-    )
 
-    monthly = f.groupby("Month")["Amount"].sum()
-    fig.add_trace(
-        go.Scatter(
-            x=monthly.index,
-            y=monthly.values,
-            mode="lines+markers",
-            line=dict(color=CARETRIA_TEAL, width=2),
-            marker=dict(size=6),
-            showlegend=False,
-        ),
-        row=2,
-        col=1,
-    )
+@cache.memoize()
+def _product_figure_json(top_n):
+    return _build_product_figure(top_n)
 
-    dow_order = [1, 2, 3, 4, 5, 6, 0]  # Mon-Sun
-    dow_labels = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    by_dow = f.groupby("DayOfWeek")["Amount"].sum().reindex(dow_order, fill_value=0)
-    fig.add_trace(
-        go.Bar(
-            x=dow_labels,
-            y=[by_dow.get(i, 0) for i in range(7)],
-            marker_color=CARETRIA_ACCENT,
-            showlegend=False,
-        ),
-        row=2,
-        col=2,
-    )
 
-    fig.update_xaxes(title_text="Month", row=2, col=1)
-    fig.update_yaxes(title_text="Revenue ($)", row=2, col=1)
-    fig.update_xaxes(title_text="Day", row=2, col=2)
-    fig.update_yaxes(title_text="Revenue ($)", row=2, col=2)
-    fig.update_xaxes(title_text="Revenue ($)", row=1, col=2)
-    apply_theme(fig, height=650)
-    return fig
+# Only depends on the Top N choice: the ranking is over all products
+@app.callback(Output("product-subplots", "figure"), Input("product-top-n-radio", "value"))
+def update_product_figures(top_n):
+    top_n = min(top_n or 5, unique_products)
+    return _product_figure_json(top_n)
 
 
 # -----------------------------------------------------------------------------
@@ -648,88 +803,84 @@ def update_product_figures(product, top_n):
 # -----------------------------------------------------------------------------
 
 
-@app.callback(
-    Output("salesperson-graph", "figure"),
-    [Input("salesperson-dropdown", "value"), Input("salesperson-top-n-radio", "value")],
-)
-def update_salesperson_graph(salesperson, top_n):
-    f = df[df["Sales Person"] == salesperson]
-    n = min(top_n or 5, f["Product"].nunique())
-
-    order_counts = f["Product"].value_counts().head(n)
-    rev_by_product = f.groupby("Product")["Amount"].sum().nlargest(n)
-    boxes_by_country = f.groupby("Country")["Boxes Shipped"].sum()
-
-    fig = make_subplots(
-        rows=2,
-        cols=2,
-        subplot_titles=(
+def _build_salesperson_figure(salesperson, top_n):
+    products_by_tx = SALESPERSON_PRODUCTS_BY_TX[salesperson]
+    n = min(top_n or 5, len(products_by_tx))
+
+    order_counts = products_by_tx.head(n)
+    rev_by_product = SALESPERSON_PRODUCTS_BY_REV[salesperson].head(n)
+    boxes_by_country = SALESPERSON_COUNTRY_BOXES.loc[salesperson]
+    boxes_by_country = boxes_by_country[boxes_by_country > 0]
+    monthly = SALESPERSON_MONTHLY.loc[salesperson]
+
+    data, layout = grid_2x2(
+        [
+            (
+                {
+                    "type": "bar",
+                    "x": order_counts.to_numpy(),
+                    "y": order_counts.index.tolist(),
+                    "orientation": "h",
+                    "marker": {"color": CARETRIA_TEAL},
+                    "showlegend": False,
+                },
+                {"xaxis": "Transactions"},
+            ),
+            (
+                {
+                    "type": "bar",
+                    "x": rev_by_product.to_numpy(),
+                    "y": rev_by_product.index.tolist(),
+                    "orientation": "h",
+                    "marker": {"color": CARETRIA_EMERALD},
+                    "showlegend": False,
+                },
+                {"xaxis": "Revenue ($)"},
+            ),
+            (
+                {
+                    "type": "bar",
+                    "x": boxes_by_country.index.tolist(),
+                    "y": boxes_by_country.to_numpy(),
+                    "marker": {"color": CARETRIA_ACCENT},
+                    "showlegend": False,
+                },
+                {"xaxis": "Country"},
+            ),
+            (
+                {
+                    "type": "scatter",
+                    "x": monthly.index.tolist(),
+                    "y": monthly.to_numpy(),
+                    "mode": "lines+markers",
+                    "line": {"color": CARETRIA_DARK, "width": 2},
+                    "marker": {"size": 6},
+                    "showlegend": False,
+                },
+                {"xaxis": "Month"},
+            ),
+        ],
+        titles=(
             "Top products by transactions",
             "Top products by revenue",
             "Boxes shipped by country",
             "Monthly revenue",
         ),
-        specs=[
-            [{"type": "bar"}, {"type": "bar"}],
-            [{"type": "bar"}, {"type": "scatter"}],
-        ],
-        vertical_spacing=0.14,
-        horizontal_spacing=0.10,
     )
+    return themed_figure(data, layout, height=700)
 
-    fig.add_trace(
-        go.Bar(
-            x=order_counts.values,
-            y=order_counts.index,
-            orientation="h",
-            marker_color=CARETRIA_TEAL,
-            showlegend=False,
-        ),
-        row=1,
-        col=1,
-    )
-    fig.add_trace(
-        go.Bar(
-            x=rev_by_product.values,
-            y=rev_by_product.index,
-            orientation="h",
-            marker_color=CARETRIA_EMERALD,
-            showlegend=False,
-        ),
-        row=1,
-        col=2,
-    )
-    fig.add_trace(
-        go.Bar(
-            x=boxes_by_country.index,
-            y=boxes_by_country.values,
-            marker_color=CARETRIA_ACCENT,
-            showlegend=False,
-        ),
-        row=2,
-        col=1,
-    )
 
-    monthly = f.groupby("Month")["Amount"].sum()
-    fig.add_trace(
-        go.Scatter(
-            x=monthly.index,
-            y=monthly.values,
-            mode="lines+markers",
-            line=dict(color=CARETRIA_DARK, width=2),
-            marker=dict(size=6),
-            showlegend=False,
-        ),
-        row=2,
-        col=2,
-    )
+@cache.memoize()
+def _salesperson_figure_json(salesperson, top_n):
+    return _build_salesperson_figure(salesperson, top_n)
 
-    fig.update_xaxes(title_text="Transactions", row=1, col=1)
-    fig.update_xaxes(title_text="Revenue ($)", row=1, col=2)
-    fig.update_xaxes(title_text="Country", row=2, col=1)
-    fig.update_xaxes(title_text="Month", row=2, col=2)
-    apply_theme(fig, height=700)
-    return fig
+
+@app.callback(
+    Output("salesperson-graph", "figure"),
+    [Input("salesperson-dropdown", "value"), Input("salesperson-top-n-radio", "value")],
+)
+def update_salesperson_graph(salesperson, top_n):
+    return _salesperson_figure_json(salesperson, top_n)
 
 
 # -----------------------------------------------------------------------------
@@ -737,108 +888,116 @@ def update_salesperson_graph(salesperson, top_n):
 # -----------------------------------------------------------------------------
 
 
+@app.callback(Output("country-agg-store", "data"), Input("country-dropdown", "value"))
+def update_country_store(country):
+    if not country:
+        raise PreventUpdate
+    return COUNTRY_SUMMARY[country]
+
+
 @app.callback(
     [
         Output("country-revenue", "children"),
         Output("country-boxes", "children"),
         Output("country-products", "children"),
     ],
-    Input("country-dropdown", "value"),
+    Input("country-agg-store", "data"),
 )
-def update_country_metrics(country):
-    if not country:
+def update_country_metrics(summary):
+    if not summary:
         raise PreventUpdate
-    f = df[df["Country"] == country]
-    rev = f["Amount"].sum()
-    boxes = f["Boxes Shipped"].sum()
-    prods = f["Product"].nunique()
     return (
-        f"Revenue: ${rev:,.0f}",
-        f"Boxes: {boxes:,}",
-        f"Products: {prods}",
+        f"Revenue: ${summary['rev']:,.0f}",
+        f"Boxes: {summary['boxes']:,}",
+        f"Products: {summary['products']}",
     )
 
 
-@app.callback(Output("country-graph", "figure"), [Input("country-dropdown", "value")])
-def update_country_graph(country):
-    f = df[df["Country"] == country]
-
-    rev_by_product = f.groupby("Product")["Amount"].sum().sort_values(ascending=True)
-    sales_by_person = f.groupby("Sales Person")["Amount"].sum().sort_values(ascending=True)
-    monthly = f.groupby("Month")["Amount"].sum()
-
-    fig = make_subplots(
-        rows=2,
-        cols=2,
-        subplot_titles=(
+def _build_country_figure(country):
+    rev_by_product = COUNTRY_PRODUCTS_BY_REV[country]
+    sales_by_person = COUNTRY_SALESPEOPLE_BY_REV[country]
+    monthly = COUNTRY_MONTHLY.loc[country]
+
+    data, layout = grid_2x2(
+        [
+            (
+                {
+                    "type": "bar",
+                    "y": rev_by_product.index.tolist(),
+                    "x": rev_by_product.to_numpy(),
+                    "orientation": "h",
+                    "marker": {"color": CARETRIA_TEAL},
+                    "showlegend": False,
+                },
+                {"xaxis": "Revenue ($)"},
+            ),
+            (
+                {
+                    "type": "bar",
+                    "y": sales_by_person.index.tolist(),
+                    "x": sales_by_person.to_numpy(),
+                    "orientation": "h",
+                    "marker": {"color": CARETRIA_EMERALD},
+                    "showlegend": False,
+                },
+                {"xaxis": "Revenue ($)"},
+            ),
+            (
+                {
+                    "type": "scatter",
+                    "x": monthly.index.tolist(),
+                    "y": monthly.to_numpy(),
+                    "mode": "lines+markers",
+                    "line": {"color": CARETRIA_DARK, "width": 2},
+                    "marker": {"size": 6},
+                    "showlegend": False,
+                },
+                {"xaxis": "Month"},
+            ),
+            (
+                {
+                    "type": "pie",
+                    "labels": rev_by_product.index.tolist(),
+                    "values": rev_by_product.to_numpy(),
+                    "hole": 0.5,
+                    "marker": {
+                        "colors": [
+                            CARETRIA_TEAL,
+                            CARETRIA_EMERALD,
+                            CARETRIA_DARK,
+                            CARETRIA_LIGHT,
+                            CARETRIA_ACCENT,
+                            "#94a3b8",
+                            "#cbd5e1",
+                        ]
+                    },
+                    "textinfo": "percent",
+                    "textposition": "inside",
+                    "showlegend": False,
+                },
+                {},
+            ),
+        ],
+        titles=(
             "Revenue by product",
             "Revenue by sales person",
             "Monthly trend",
             "Product mix (pie)",
         ),
-        specs=[
-            [{"type": "bar"}, {"type": "bar"}],
-            [{"type": "scatter"}, {"type": "pie"}],
-        ],
-        vertical_spacing=0.14,
-        horizontal_spacing=0.10,
     )
+    return themed_figure(data, layout, height=700)
 
-    fig.add_trace(
-        go.Bar(
-            y=rev_by_product.index,
-            x=rev_by_product.values,
-            orientation="h",
-            marker_color=CARETRIA_TEAL,
-            showlegend=False,
-        ),
-        row=1,
-        col=1,
-    )
-    fig.add_trace(
-        go.Bar(
-            y=sales_by_person.index,
-            x=sales_by_person.values,
-            orientation="h",
-            marker_color=CARETRIA_EMERALD,
-            showlegend=False,
-        ),
-        row=1,
-        col=2,
-    )
-    fig.add_trace(
-        go.Scatter(
-            x=monthly.index,
-            y=monthly.values,
-            mode="lines+markers",
-            line=dict(color=CARETRIA_DARK, width=2),
-            marker=dict(size=6),
-            showlegend=False,
-        ),
-        row=2,
-        col=1,
-    )
-    fig.add_trace(
-        go.Pie(
-            labels=rev_by_product.index,
-            values=rev_by_product.values,
-            hole=0.5,
-            marker=dict(
-                colors=[CARETRIA_TEAL, CARETRIA_EMERALD, CARETRIA_DARK, CARETRIA_LIGHT, CARETRIA_ACCENT, "#94a3b8", "#cbd5e1"]
-            ),
-            textinfo="percent",
-            textposition="inside",
-            showlegend=False,
-        ),
-        row=2,
-        col=2,
-    )
 
-    fig.update_xaxes(title_text="Revenue ($)", row=1, col=1)
-    fig.update_xaxes(title_text="Revenue ($)", row=1, col=2)
-    fig.update_xaxes(title_text="Month", row=2, col=1)
-    apply_theme(fig, height=700)
-    return fig
+@cache.memoize()
+def _country_figure_json(country):
+    return _build_country_figure(country)
+
+
+@app.callback(Output("country-graph", "figure"), Input("country-agg-store", "data"))
+def update_country_graph(summary):
+    if not summary:
+        raise PreventUpdate
+    return _country_figure_json(summary["country"])
 
 
 # -----------------------------------------------------------------------------
@@ -846,23 +1005,28 @@ def update_country_graph(country):
 # -----------------------------------------------------------------------------
 
 
-@app.callback(
-    [
-        Output("insight-gauge", "figure"),
-        Output("insight-country-pie", "figure"),
-        Output("insight-revenue-trend", "figure"),
-        Output("insight-boxes-histogram", "figure"),
-    ],
-    [Input("tabs", "value"), Input("insight-product-selector", "value")],
-)
-def update_product_insights(tab_value, product):
-    if tab_value != "tab-4":
-        raise PreventUpdate
-    if not product or product not in df["Product"].unique():
-        product = df["Product"].unique()[0]
-    f = df[df["Product"] == product]
+def _summarize_product(f):
+    """Aggregations behind the Product Insights charts for one product's rows."""
+    by_country = f.groupby("Country", observed=True)["Amount"].sum()
+    return {
+        "avg_amount": f["Amount"].mean(),
+        "amount_max": f["Amount"].max(),
+        "by_country": by_country,
+        # Slice labels preformatted the way Plotly's textinfo="percent" would (3 significant digits)
+        "by_country_pct": [f"{share * 100:.3g}%" for share in by_country / by_country.sum()],
+        "monthly": f.groupby("Month")["Amount"].sum(),
+        "boxes": f["Boxes Shipped"],
+        "boxes_nbins": min(20, max(5, f["Boxes Shipped"].nunique())),
+    }
+
+
+PRODUCT_CACHE = {p: _summarize_product(f) for p, f in df.groupby("Product", observed=True)}
 
-    avg_amount = f["Amount"].mean()
+
+def _build_product_insights(product):
+    c = PRODUCT_CACHE[product]
+
+    avg_amount = c["avg_amount"]
     gauge_fig = go.Figure(
         go.Indicator(
             mode="gauge+number",
@@ -871,7 +1035,7 @@ def update_product_insights(tab_value, product):
             domain={"x": [0.1, 0.9], "y": [0.15, 0.85]},
             title={"text": "Avg Order Value", "font": {"size": 14}},
             gauge={
-                "axis": {"range": [0, f["Amount"].max() * 1.1], "tickwidth": 1},
+                "axis": {"range": [0, c["amount_max"] * 1.1], "tickwidth": 1},
                 "bar": {"color": CARETRIA_TEAL},
                 "bgcolor": "white",
                 "borderwidth": 2,
@@ -879,7 +1043,7 @@ def update_product_insights(tab_value, product):
                 "steps": [
                     {"range": [0, avg_amount * 0.33], "color": "#f1f5f9"},
                     {"range": [avg_amount * 0.33, avg_amount * 0.66], "color": "#e2e8f0"},
-                    {"range": [avg_amount * 0.66, f["Amount"].max() * 1.1], "color": "#cbd5e1"},
+                    {"range": [avg_amount * 0.66, c["amount_max"] * 1.1], "color": "#cbd5e1"},
                 ],
                 "threshold": {
                     "line": {"color": CARETRIA_TEAL, "width": 4},
@@ -887,11 +1051,11 @@ def update_product_insights(tab_value, product):
                     "value": avg_amount,
                 },
             },
-        )
+        ),
+        layout=LAYOUTS[280],
     )
-    apply_theme(gauge_fig, height=280)
 
-    by_country = f.groupby("Country")["Amount"].sum()
+    by_country = c["by_country"]
     pie_fig = go.Figure(
         data=[
             go.Pie(
@@ -901,12 +1065,14 @@ def update_product_insights(tab_value, product):
                 marker=dict(
                     colors=[CARETRIA_TEAL, CARETRIA_EMERALD, CARETRIA_DARK, CARETRIA_LIGHT, CARETRIA_ACCENT]
                 ),
-                textinfo="percent",
+                text=c["by_country_pct"],
+                textinfo="text",
                 textposition="inside",
                 insidetextorientation="horizontal",
                 hovertemplate="%{label}<br>Revenue: $%{value:,.0f}<extra></extra>",
             )
-        ]
+        ],
+        layout=LAYOUTS[280],
     )
     pie_fig.update_layout(
         title_text="Revenue by Country",
@@ -915,10 +1081,9 @@ def update_product_insights(tab_value, product):
         showlegend=True,
         legend=dict(orientation="h", yanchor="top", y=-0.05),
     )
-    apply_theme(pie_fig, height=280)
 
-    monthly = f.groupby("Month")["Amount"].sum()
-    trend_fig = go.Figure()
+    monthly = c["monthly"]
+    trend_fig = go.Figure(layout=LAYOUTS[280])
     trend_fig.add_trace(
         go.Scatter(
             x=monthly.index,
@@ -934,13 +1099,12 @@ def update_product_insights(tab_value, product):
         xaxis_title="Month",
         yaxis_title="Revenue ($)",
     )
-    apply_theme(trend_fig, height=280)
 
-    hist_fig = go.Figure()
+    hist_fig = go.Figure(layout=LAYOUTS[280])
     hist_fig.add_trace(
         go.Histogram(
-            x=f["Boxes Shipped"],
-            nbinsx=min(20, max(5, f["Boxes Shipped"].nunique())),
+            x=c["boxes"],
+            nbinsx=c["boxes_nbins"],
             marker_color=CARETRIA_EMERALD,
         )
     )
@@ -949,31 +1113,85 @@ def update_product_insights(tab_value, product):
         xaxis_title="Boxes",
         yaxis_title="Count",
     )
-    apply_theme(hist_fig, height=280)
 
-    return gauge_fig, pie_fig, trend_fig, hist_fig
+    return tuple(fig.to_plotly_json() for fig in (gauge_fig, pie_fig, trend_fig, hist_fig))
+
+
+@cache.memoize()
+def _product_insights_json(product):
+    return _build_product_insights(product)
+
+
+@app.callback(
+    [
+        Output("insight-gauge", "figure"),
+        Output("insight-country-pie", "figure"),
+        Output("insight-revenue-trend", "figure"),
+        Output("insight-boxes-histogram", "figure"),
+    ],
+    [Input("tabs", "value"), Input("insight-product-selector", "value")],
+)
+def update_product_insights(tab_value, product):
+    if tab_value != "tab-4":
+        raise PreventUpdate
+    if not product or product not in PRODUCT_CACHE:
+        product = PRODUCT_DEFAULT
+    return _product_insights_json(product)
 
 
 # -----------------------------------------------------------------------------
 # Tab 5: Statistical Analysis Callbacks
 # -----------------------------------------------------------------------------
 
+numeric_cols = ["Boxes Shipped", "Amount"]
+
+
+TRANSFORMS = {"log": np.log1p, "sqrt": np.sqrt}
+
+
+def _stat_column(values, n_sample=1000):
+    """Precompute everything the Statistical Analysis charts read for one column.
+
+    NaNs are dropped once; the seeded sample (a fixed random_state makes it
+    identical on every call) is shared by the Q-Q plot and the normality tests.
+    """
+    values = values.dropna()
+    arr = values.to_numpy()
+    q1, q3 = np.quantile(arr, [0.25, 0.75])
+    iqr = q3 - q1
+    sample = values.sample(n=min(n_sample, len(values)), replace=False, random_state=42).to_numpy(dtype="float64")
+    transforms = {}
+    for name, fn in TRANSFORMS.items():
+        transformed = fn(arr.astype("float64"))  # float16 ufunc results for narrow ints otherwise
+        transforms[name] = (transformed, min(40, max(15, int(np.unique(transformed).size / 2))))
+    return {
+        "arr": arr,
+        "filtered": arr[(arr >= q1 - 1.5 * iqr) & (arr <= q3 + 1.5 * iqr)],
+        "sample": sample,
+        "sample_sorted": np.sort(sample),
+        "sample_mean": sample.mean(),
+        "sample_std": sample.std(ddof=1),
+        "transforms": transforms,
+    }
+
+
+# Column-oriented cache shared by every tab 5 chart
+STAT_COLS = {col: _stat_column(df[col]) for col in numeric_cols}
+
+
 # Boxplot
-@app.callback(Output("stat-boxplot", "figure"), Input("stat-feature-dropdown", "value"))
-def update_boxplot(feature):
-    data_col = df[feature].dropna()
-    Q1 = data_col.quantile(0.25)
-    Q3 = data_col.quantile(0.75)
-    IQR = Q3 - Q1
-    filtered = df[(df[feature] >= Q1 - 1.5 * IQR) & (df[feature] <= Q3 + 1.5 * IQR)][feature]
+def _build_boxplot(feature):
+    column_stats = STAT_COLS[feature]
+    full, filtered = column_stats["arr"], column_stats["filtered"]
 
     fig = make_subplots(
         rows=1,
         cols=2,
         subplot_titles=("With outliers", "IQR filtered"),
+        figure=go.Figure(layout=LAYOUTS[340]),
     )
     fig.add_trace(
-        go.Box(y=df[feature], name="With outliers", marker_color=CARETRIA_TEAL, line_color=CARETRIA_DARK),
+        go.Box(y=full, name="With outliers", marker_color=CARETRIA_TEAL, line_color=CARETRIA_DARK),
         row=1,
         col=1,
     )
@@ -983,39 +1201,69 @@ def update_boxplot(feature):
         col=2,
     )
     fig.update_layout(showlegend=False)
-    apply_theme(fig, height=340)
-    return fig
+    return fig.to_plotly_json()
+
+
+@cache.memoize()
+def _boxplot_json(feature):
+    return _build_boxplot(feature)
 
 
-# QQ plot and normality
 @app.callback(
-    [Output("stat-qq-plot", "figure"), Output("normality-test-result", "children")],
-    [
-        Input("normality-column", "value"),
-        Input("normality-test", "value"),
-    ],
+    Output("stat-boxplot", "figure"),
+    [Input("tabs", "value"), Input("stat-feature-dropdown", "value")],
 )
-def update_qq_and_test(column, test_type):
-    sample = df[column].dropna()
-    n = min(1000, len(sample))
-    data = sample.sample(n=n, replace=False, random_state=42)
+def update_boxplot(tab_value, feature):
+    if tab_value != "tab-5":
+        raise PreventUpdate
+    return _boxplot_json(feature)
 
+
+# QQ plot and normality
+@lru_cache(maxsize=32)
+def _qq_cached(column):
+    """Return ``(osm, osr, mean, std)`` for the Q-Q plot of the seeded sample of ``column``.
+
+    Theoretical quantiles are the inverse normal CDF at Blom's plotting
+    positions ``(i - 0.375) / (n + 0.25)``, and the reference line is
+    ``mean + std * osm``, so no regression fit is needed.
+    """
+    from scipy.special import ndtri
+
+    column_stats = STAT_COLS[column]
+    osr = column_stats["sample_sorted"]
+    n = len(osr)
+    osm = ndtri((np.arange(1, n + 1) - 0.375) / (n + 0.25))
+    return osm, osr, column_stats["sample_mean"], column_stats["sample_std"]
+
+
+@lru_cache(maxsize=64)
+def _run_normality(column, test_type):
+    """Return ``(stat, p, test_name)`` for ``test_type`` on the seeded sample of ``column``."""
+    from scipy.stats import kstest, normaltest, shapiro
+
+    column_stats = STAT_COLS[column]
+    data = column_stats["sample"]
     if test_type == "shapiro":
         stat, p = shapiro(data)
         test_name = "Shapiro-Wilk"
     elif test_type == "ks":
-        stat, p = kstest(data, "norm", args=(data.mean(), data.std()))
+        stat, p = kstest(data, "norm", args=(column_stats["sample_mean"], column_stats["sample_std"]))
         test_name = "Kolmogorov-Smirnov"
     else:
         stat, p = normaltest(data)
         test_name = "D'Agostino K²"
+    return stat, p, test_name
 
-    (osm, osr), (slope, intercept, _) = stats.probplot(data, dist="norm")
-    fig = go.Figure()
+
+def _build_qq_and_test(column, test_type):
+    stat, p, test_name = _run_normality(column, test_type)
+    osm, osr, mean, std = _qq_cached(column)
+    fig = go.Figure(layout=LAYOUTS[300])
     fig.add_trace(
         go.Scatter(
             x=osm,
-            y=osr * slope + intercept,
+            y=mean + std * osm,
             mode="lines",
             name="Theoretical",
             line=dict(color="#94a3b8", dash="dash"),
@@ -1035,86 +1283,136 @@ def update_qq_and_test(column, test_type):
         xaxis_title="Theoretical quantiles",
         yaxis_title="Sample quantiles",
     )
-    apply_theme(fig, height=300)
     result_text = f"{test_name}: stat = {stat:.3f}, p = {p:.4f}"
-    return fig, result_text
+    return fig.to_plotly_json(), result_text
+
+
+@cache.memoize()
+def _qq_and_test_json(column, test_type):
+    return _build_qq_and_test(column, test_type)
 
 
-# Transformation
 @app.callback(
-    Output("stat-transformed", "figure"),
-    [Input("transformation-feature", "value"), Input("transformation-type", "value")],
+    [Output("stat-qq-plot", "figure"), Output("normality-test-result", "children")],
+    [
+        Input("tabs", "value"),
+        Input("normality-column", "value"),
+        Input("normality-test", "value"),
+    ],
 )
-def update_transformed(feature, transform_type):
-    raw = df[feature].dropna()
+def update_qq_and_test(tab_value, column, test_type):
+    if tab_value != "tab-5":
+        raise PreventUpdate
+    return _qq_and_test_json(column, test_type)
+
+
+# Transformation
+def _build_transformed(feature, transform_type):
     if transform_type == "log":
-        transformed = np.log1p(raw)
         title = f"Log(1 + {feature})"
     else:
-        transformed = np.sqrt(raw)
         title = f"√{feature}"
-    fig = go.Figure()
+        transform_type = "sqrt"
+    transformed, nbins = STAT_COLS[feature]["transforms"][transform_type]
+    fig = go.Figure(layout=LAYOUTS[300])
     fig.add_trace(
         go.Histogram(
             x=transformed,
-            nbinsx=min(40, max(15, int(transformed.nunique() / 2))),
+            nbinsx=nbins,
             marker_color=CARETRIA_TEAL,
         )
     )
     fig.update_layout(title_text=title, xaxis_title="Value", yaxis_title="Count")
-    apply_theme(fig, height=300)
-    return fig
+    return fig.to_plotly_json()
+
+
+@cache.memoize()
+def _transformed_json(feature, transform_type):
+    return _build_transformed(feature, transform_type)
+
+
+@app.callback(
+    Output("stat-transformed", "figure"),
+    [Input("tabs", "value"), Input("transformation-feature", "value"), Input("transformation-type", "value")],
+)
+def update_transformed(tab_value, feature, transform_type):
+    if tab_value != "tab-5":
+        raise PreventUpdate
+    return _transformed_json(feature, transform_type)
 
 
 # Scatter and correlation
-numeric_cols = ["Boxes Shipped", "Amount"]
 corr_matrix = df[numeric_cols].corr()
+# Row-aligned transaction count of each row's product, for the "_product_count" x option
+PRODUCT_COUNT = df["Product"].map(df["Product"].value_counts()).to_numpy(dtype="int64")
+
+
+def _build_scatter(x_col, y_col, show_trend):
+    x_vals = PRODUCT_COUNT if x_col == "_product_count" else df[x_col].to_numpy()
+    y_vals = df[y_col].to_numpy()
+
+    # WebGL traces keep browser rendering fast as the row count grows
+    fig = go.Figure(
+        go.Scattergl(
+            x=x_vals,
+            y=y_vals,
+            mode="markers",
+            marker=dict(color=CARETRIA_TEAL, size=6, opacity=0.6, line=dict(width=0)),
+            hovertemplate=f"{x_col}=%{{x}}<br>{y_col}=%{{y}}<extra></extra>",
+            showlegend=False,
+        ),
+        layout=LAYOUTS[340],
+    )
+    fig.update_layout(
+        title_text=f"{x_col} vs {y_col}",
+        xaxis_title=x_col,
+        yaxis_title=y_col,
+    )
+    r_squared = ""
+    if show_trend:
+        # Closed-form least-squares line; a two-column fit does not need statsmodels
+        x = x_vals.astype("float64")
+        y = y_vals.astype("float64")
+        m, b = np.polyfit(x, y, 1)
+        ss_res = ((y - (m * x + b)) ** 2).sum()
+        ss_tot = ((y - y.mean()) ** 2).sum()
+        x_line = np.array([x.min(), x.max()])
+        fig.add_trace(
+            go.Scattergl(
+                x=x_line,
+                y=m * x_line + b,
+                mode="lines",
+                name="OLS trend",
+                line=dict(color=CARETRIA_DARK, width=2),
+                showlegend=False,
+            )
+        )
+        r_squared = f"R² = {1 - ss_res / ss_tot:.4f}"
+    return fig.to_plotly_json(), r_squared
+
+
+@cache.memoize()
+def _scatter_json(x_col, y_col, show_trend):
+    return _build_scatter(x_col, y_col, show_trend)
 
 
 @app.callback(
     [Output("stat-scatter", "figure"), Output("r-squared-value", "children")],
     [
+        Input("tabs", "value"),
         Input("scatter-x", "value"),
         Input("scatter-y", "value"),
         Input("scatter-trendline", "value"),
     ],
 )
-def update_scatter(x_col, y_col, trendline_val):
-    show_trend = "show" in (trendline_val or [])
-    sample_df = df.copy()
-    if x_col == "_product_count":
-        sample_df["_product_count"] = sample_df.groupby("Product")["Product"].transform("count")
-        x_col_use = "_product_count"
-    else:
-        x_col_use = x_col
-
-    fig = px.scatter(
-        data_frame=sample_df,
-        x=x_col_use,
-        y=y_col,
-        opacity=0.6,
-        trendline="ols" if show_trend else None,
-    )
-    fig.update_traces(marker=dict(size=6, line=dict(width=0)), selector=dict(mode="markers"))
-    fig.update_layout(
-        title_text=f"{x_col_use} vs {y_col}",
-        xaxis_title=x_col_use,
-        yaxis_title=y_col,
-    )
-    r_squared = ""
-    if show_trend:
-        try:
-            results = px.get_trendline_results(fig)
-            r2 = results.px_fit_results.iloc[0].rsquared
-            r_squared = f"R² = {r2:.4f}"
-        except Exception:
-            pass
-    apply_theme(fig, height=340)
-    return fig, r_squared
-
-
-@app.callback(Output("stat-correlation", "figure"), Input("transformation-type", "value"))
-def update_correlation(_):
+def update_scatter(tab_value, x_col, y_col, trendline_val):
+    if tab_value != "tab-5":
+        raise PreventUpdate
+    return _scatter_json(x_col, y_col, "show" in (trendline_val or []))
+
+
+# The heatmap has no inputs, so it is built once and placed in the layout directly
+def _build_correlation():
     fig = go.Figure(
         go.Heatmap(
             z=corr_matrix.values,
@@ -1124,17 +1422,39 @@ def update_correlation(_):
             text=np.round(corr_matrix.values, 2),
             texttemplate="%{text}",
             textfont=dict(size=11),
-        )
+        ),
+        layout=LAYOUTS[340],
     )
     fig.update_layout(title_text="Correlation matrix")
-    apply_theme(fig, height=340)
-    return fig
+    return fig.to_plotly_json()
+
+
+CORR_FIG = _build_correlation()
 
 
 # -----------------------------------------------------------------------------
 # Server
 # -----------------------------------------------------------------------------
 
+
+def warm_figure_cache():
+    """Populate the figure cache for every selectable tab 1-4 input and the boxplot features."""
+    for top_n in (5, 10):
+        _product_figure_json(min(top_n, unique_products))
+    salespeople = [o["value"] for o in SALESPERSON_OPTIONS]
+    for salesperson, top_n in itertools.product(salespeople, (5, 10, 20)):
+        _salesperson_figure_json(salesperson, top_n)
+    for country in [o["value"] for o in COUNTRY_OPTIONS]:
+        _country_figure_json(country)
+    for product in PRODUCT_CACHE:
+        _product_insights_json(product)
+    for feature in numeric_cols:
+        _boxplot_json(feature)
+
+
+# Warm in the background so startup (and each worker boot) is not delayed
+threading.Thread(target=warm_figure_cache, name="warm-figure-cache", daemon=True).start()
+
 server = app.server
 
 if __name__ == "__main__":